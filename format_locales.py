@@ -0,0 +1,19 @@
+import logging
+import sys
+from pathlib import Path
+
+from locales_util import EN_PATH, ZH_PATH, dump_json, load_json, log, write_atomic
+
+def format_json(path):
+    raw = Path(path).read_bytes()
+    payload = dump_json(load_json(raw), compact=False)
+    if payload == raw:
+        log.info("Unchanged %s", path)
+    else:
+        write_atomic(path, payload)
+        log.info("Formatted %s", path)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    for path in sys.argv[1:] or (EN_PATH, ZH_PATH):
+        format_json(path)
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger('update_locales')
+
+EN_PATH = 'app/locales/en.json'
+ZH_PATH = 'app/locales/zh.json'
+FRAGMENTS_DIR = Path(__file__).resolve().parent / 'locales_fragments'
+STAMP_DIR = Path('.cache/update_locales')
+COMPACT = os.environ.get('LOCALES_COMPACT') == '1'
+MISSING = object()
+
+def load_json(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_fragment(name):
+    return load_json((FRAGMENTS_DIR / name).read_bytes())
+
+def is_leaf(value):
+    if type(value) is list:
+        return all(type(item) is str for item in value)
+    return type(value) is str
+
+def validate(tree, name):
+    stack = [tree]
+    while stack:
+        for key, value in stack.pop().items():
+            if '.' in key:
+                raise ValueError(f"{name}: key {key!r} must not contain '.'")
+            if type(value) is dict:
+                stack.append(value)
+            elif not is_leaf(value):
+                raise ValueError(f"{name}: unsupported value for {key!r}: {value!r}")
+    return tree
+
+def dump_json(data, compact=COMPACT):
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    return (text + '\n').encode('utf-8')
+
+def flatten(tree):
+    stack = [((), iter(tree.items()))]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        prefix, items = stack[-1]
+        leaves = {}
+        for key, value in items:
+            key = sys.intern(key)
+            if type(value) is dict:
+                push((prefix + (key,), iter(value.items())))
+                break
+            leaves[key] = sys.intern(value) if type(value) is str else value
+        else:
+            pop()
+        if leaves:
+            yield prefix, tuple(leaves.items())
+
+def overlay(target, runs):
+    changed = False
+    for path, leaves in runs:
+        node = target
+        for key in path:
+            child = node.get(key)
+            if type(child) is not dict:
+                child = node[key] = {}
+            node = child
+        get = node.get
+        updates = [(key, value) for key, value in leaves if get(key, MISSING) != value]
+        if updates:
+            node.update(updates)
+            changed = True
+    return changed
+
+def write_atomic(path, payload):
+    tmp = f'{path}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+def unflatten(flat):
+    tree = {}
+    for path, value in flat.items():
+        *parents, leaf = path.split('.')
+        node = tree
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return tree
+
+def stamp_for(path, patch):
+    h = hashlib.blake2b(path.encode('utf-8'), digest_size=16)
+    h.update(dump_json(patch))
+    return STAMP_DIR / h.hexdigest()
+
+def file_signature(path):
+    st = os.stat(path)
+    return f'{st.st_mtime_ns} {st.st_size}'
+
+def leaf_paths(patch):
+    return {prefix + (key,) for prefix, leaves in patch for key, _ in leaves}
+
+def load_patches(name):
+    en_name = f'{name}.en.json'
+    zh_name = f'{name}.zh.flat.json'
+    patch_en = tuple(flatten(validate(load_fragment(en_name), en_name)))
+    patch_zh = tuple(flatten(validate(unflatten(load_fragment(zh_name)), zh_name)))
+    untranslated = leaf_paths(patch_en) ^ leaf_paths(patch_zh)
+    if untranslated:
+        log.warning("%s and %s disagree on: %s", zh_name, en_name, ', '.join(sorted('.'.join(p) for p in untranslated)))
+    return patch_en, patch_zh
+
+def combine_patches(names):
+    patches = [load_patches(name) for name in names]
+    patch_en = tuple(run for en, _ in patches for run in en)
+    patch_zh = tuple(run for _, zh in patches for run in zh)
+    return patch_en, patch_zh
+
+def stamp_matches(stamp, path):
+    try:
+        return stamp.read_text() == file_signature(path)
+    except OSError:
+        return False
+
+def load_catalog(path):
+    try:
+        return load_json(Path(path).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        log.error("Error reading %s: %s", path, e)
+    except ValueError as e:
+        log.error("Error parsing %s: %s", path, e)
+    return None
+
+def update_json(path, patch):
+    stamp = stamp_for(path, patch)
+    if stamp_matches(stamp, path):
+        log.info("Unchanged %s", path)
+        return
+    data = load_catalog(path)
+    if data is None:
+        return
+    changed = overlay(data, patch)
+    try:
+        if changed:
+            write_atomic(path, dump_json(data))
+        STAMP_DIR.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(file_signature(path))
+    except OSError as e:
+        log.error("Error writing %s: %s", path, e)
+        return
+    log.info("Updated %s" if changed else "Unchanged %s", path)
+
+def check_json(path, patch):
+    if stamp_matches(stamp_for(path, patch), path):
+        log.info("Up to date %s", path)
+        return True
+    data = load_catalog(path)
+    if data is None:
+        return False
+    expected = {prefix + (key,): value for prefix, leaves in patch for key, value in leaves}
+    stale = []
+    for leaf_path, value in expected.items():
+        node = data
+        for key in leaf_path:
+            node = node.get(key, MISSING) if type(node) is dict else MISSING
+        if node != value:
+            stale.append('.'.join(leaf_path))
+    if stale:
+        log.error("Out of date %s: %s", path, ', '.join(stale))
+        return False
+    log.info("Up to date %s", path)
+    return True
+
+def main(locales):
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    check = '--check' in sys.argv[1:]
+    with ThreadPoolExecutor(max_workers=len(locales)) as executor:
+        if check:
+            ok = all(list(executor.map(lambda locale: check_json(*locale), locales)))
+            sys.exit(0 if ok else 1)
+        list(executor.map(lambda locale: update_json(*locale), locales))
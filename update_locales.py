@@ -0,0 +1,13 @@
+from locales_util import EN_PATH, ZH_PATH, combine_patches, main
+
+FRAGMENTS = ('all', 'analysis', 'part2', 'part3')
+
+PATCH_EN, PATCH_ZH = combine_patches(FRAGMENTS)
+
+LOCALES = (
+    (EN_PATH, PATCH_EN),
+    (ZH_PATH, PATCH_ZH),
+)
+
+if __name__ == "__main__":
+    main(LOCALES)